@@ -0,0 +1,50 @@
+"""
+Micro benchmarks of the core classes
+
+Run with `tox -e bench` and `tox -e bench-compiled`
+to compare the pure Python and the compiled modules.
+"""
+
+import timeit
+
+import numpy as np
+
+import fastunits
+from fastunits.dimensions import dimensions_from_base
+from fastunits.units import Unit
+
+T, L, M = dimensions_from_base("TLM")
+
+m = Unit.base(L, "m")
+cm = m.derived(1e-2, "cm")
+s = Unit.base(T, "s")
+
+q1 = 10 << cm
+q2 = 1 << m
+qv1 = np.random.randn(10_000) << m
+qv2 = np.random.randn(10_000) << cm
+
+BENCHMARKS = {
+    "Dimension.__mul__": lambda: L * T,
+    "Dimension.__pow__": lambda: L ** 2,
+    "Unit.__mul__": lambda: m * s,
+    "Unit.__truediv__": lambda: m / s,
+    "Unit.__pow__": lambda: m ** 2,
+    "ScalarQuantity creation": lambda: 1.0 << m,
+    "ScalarQuantity.to_value": lambda: q1.to_value(m),
+    "ScalarQuantity.__add__": lambda: q1 + q2,
+    "ScalarQuantity.__mul__": lambda: q1 * q2,
+    "ArrayQuantity.__add__": lambda: qv1 + qv2,
+}
+
+
+def main(number: int = 10_000, repeat: int = 5) -> None:
+    backend = "compiled" if fastunits.is_compiled() else "pure Python"
+    print(f"fastunits {fastunits.__version__} ({backend})")
+    for name, func in BENCHMARKS.items():
+        best = min(timeit.repeat(func, number=number, repeat=repeat))
+        print(f"{name:<30} {best / number * 1e6:8.3f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -52,9 +52,9 @@ print(2 * qv1)
 # angles as dimensionless quantities is a bit of a mess https://doi.org/10.1088/0026-1394/53/3/998
 # we choose not to take a stance
 # Step 3: Proper testing of unit and quantity printing
+# Step 7: Different CODATA versions (see fastunits.systems)
+# Step 5: Optional compilation with Cython (see setup.py and benchmarks/run.py)
 
 # To do:
 # Step 4: Mathematical operations (NumPy ufuncs) including angles (conversion to radians)
-# Step 5: Try more micro optimizations (compile with Cython?)
 # Step 6: Complete SI units
-# Step 7: Different CODATA versions
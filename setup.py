@@ -0,0 +1,23 @@
+import os
+
+from setuptools import Extension, setup
+
+# Optional compiled versions of the core classes, with the pure Python modules
+# as fallback, like https://github.com/Quansight-Labs/ndindex/pull/127.
+# Each fastunits/_<module>.pyx must keep the semantics of fastunits/<module>.py
+CYTHONIZE = os.environ.get("FASTUNITS_CYTHONIZE") == "1"
+COMPILED_MODULES = ["dimensions", "units", "quantities"]
+
+if CYTHONIZE:
+    # Cython is only needed, and only required, when building the compiled modules.
+    # setuptools uses it to translate .pyx sources when it is installed
+    ext_modules = [
+        Extension(f"fastunits._{name}", [f"src/fastunits/_{name}.pyx"])
+        for name in COMPILED_MODULES
+    ]
+    setup_requires = ["Cython>=3"]
+else:
+    ext_modules = []
+    setup_requires = []
+
+setup(ext_modules=ext_modules, setup_requires=setup_requires)
@@ -7,3 +7,16 @@ A fast physical units library compatible with NumPy
 from __future__ import annotations
 
 __version__ = "0.1"
+
+
+def is_compiled() -> bool:
+    # True when the optional compiled versions of the core classes are in use,
+    # see setup.py
+    from .dimensions import Dimension
+    from .quantities import ScalarQuantity
+    from .units import Unit
+
+    return all(
+        cls.__module__.startswith("fastunits._")
+        for cls in (Dimension, Unit, ScalarQuantity)
+    )
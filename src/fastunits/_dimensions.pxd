@@ -0,0 +1,3 @@
+cdef class Dimension:
+    cdef public object _vector
+    cdef public object _base
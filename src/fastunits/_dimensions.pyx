@@ -0,0 +1,40 @@
+# cython: language_level=3
+# Compiled version of fastunits.dimensions.Dimension,
+# which must keep the same semantics (see setup.py)
+import numpy as np
+from npytypes.rational import rational as R
+
+from .printing import rational_exponent_str
+
+
+cdef class Dimension:
+    def __init__(self, vector, base):
+        self._vector = vector
+        self._base = base
+
+    @classmethod
+    def create(cls, name, base):
+        # This will raise a ValueError if `name` not found in `base`
+        vector = np.zeros(len(base), dtype=R)
+        if name:
+            position = base.index(name)
+            vector[position] = 1
+
+        return cls(vector, base)
+
+    def __mul__(self, other):
+        # FIXME: Turn into proper error
+        assert self._base is other._base
+        return Dimension(self._vector + other._vector, self._base)
+
+    def __pow__(self, other):
+        return Dimension(R(other) * self._vector, self._base)
+
+    def __repr__(self):
+        fragments = []
+        for index, exponent in enumerate(self._vector):
+            fragments.append(f"{self._base[index]}{rational_exponent_str(exponent)}")
+        return "".join(fragments)
+
+    def __eq__(self, other):
+        return (self._vector == other._vector).all() and (self._base == other._base)
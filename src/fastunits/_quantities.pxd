@@ -0,0 +1,7 @@
+cdef class _BaseQuantity:
+    cdef public object _value
+    cdef public object _unit
+
+
+cdef class ScalarQuantity(_BaseQuantity):
+    pass
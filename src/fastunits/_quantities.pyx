@@ -0,0 +1,83 @@
+# cython: language_level=3
+# Compiled versions of fastunits.quantities._BaseQuantity and ScalarQuantity,
+# which must keep the same semantics (see setup.py)
+from ._units cimport Unit
+
+from .quantities import _affine_kernel
+from .units import AffineUnitsError, IncommensurableUnitsError, affine_conversion
+
+
+cdef class _BaseQuantity:
+    def __init__(self, value, unit):
+        self._value = value
+        self._unit = unit
+
+    @property
+    def unit(self):
+        return self._unit
+
+    def __repr__(self):
+        suffix = self._unit.to_str()
+        return f"{self._value} {suffix}" if suffix else f"{self._value}"
+
+    def __mul__(self, other):
+        if not isinstance(other, _BaseQuantity):
+            return NotImplemented
+
+        return self.__class__(self._value * other._value, self._unit * other._unit)
+
+    def __rmul__(self, other):
+        # Assume other is a number
+        if self._unit._offset:
+            raise AffineUnitsError("Cannot multiply a quantity with offset units")
+        return self.__class__(self._value * other, self._unit)
+
+    def __add__(self, other):
+        if not isinstance(other, _BaseQuantity):
+            return NotImplemented
+
+        if self._unit._offset or other._unit._offset:
+            return self._add_affine(other)
+
+        other_converted_value = other.to_value(self._unit)
+        return self.__class__(self._value + other_converted_value, self._unit)
+
+    def _add_affine(self, other):
+        # Absolute values can only be added to differences
+        if self._unit._offset and other._unit._offset:
+            raise AffineUnitsError("Cannot add two quantities with offset units")
+        elif other._unit._offset:
+            return other._add_affine(self)
+
+        other_converted_value = other.to_value(self._unit.delta)
+        return self.__class__(self._value + other_converted_value, self._unit)
+
+    def to_value(self, unit):
+        cdef Unit source, target
+        if type(self._unit) is Unit and type(unit) is Unit:
+            # Fast path for the most common case, accessing the attributes directly
+            source = <Unit>self._unit
+            target = <Unit>unit
+            if target._dimensions != source._dimensions:
+                raise IncommensurableUnitsError("Incommensurable quantities")
+            if source._offset == 0.0 and target._offset == 0.0:
+                return (source._multiplier / target._multiplier) * self._value
+
+        if unit._dimensions != self._unit._dimensions:
+            raise IncommensurableUnitsError("Incommensurable quantities")
+
+        if not (self._unit._offset or unit._offset):
+            return (self._unit._multiplier / unit._multiplier) * self._value
+
+        return _affine_kernel(self._value, *affine_conversion(self._unit, unit))
+
+    def to(self, unit):
+        return self.__class__(self.to_value(unit), unit)
+
+
+cdef class ScalarQuantity(_BaseQuantity):
+    def __eq__(self, other):
+        return self.exactly_equal(other) or self.exactly_equal(other.to(self.unit))
+
+    def exactly_equal(self, other):
+        return bool((self.unit == other.unit) and (self._value == other._value))
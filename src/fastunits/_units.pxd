@@ -0,0 +1,5 @@
+cdef class Unit:
+    cdef public object _multiplier
+    cdef public object _dimensions
+    cdef public object _names
+    cdef public double _offset
@@ -0,0 +1,108 @@
+# cython: language_level=3
+# Compiled version of fastunits.units.Unit,
+# which must keep the same semantics (see setup.py)
+from .printing import rational_exponent_str
+from .units import _Dimensionless
+
+
+cdef class Unit:
+
+    # Trick to make `np.array([...]) << unit` work,
+    # borrowed from https://github.com/astropy/astropy/blob/d1e122d/\
+    # astropy/units/core.py#L630-L632
+    __array_priority__ = 1001
+
+    def __init__(self, multiplier, dimensions, names):
+        self._multiplier = multiplier
+        self._dimensions = dimensions
+        self._names = names
+        # Purely multiplicative units have no offset,
+        # see AffineUnit for the ones that do
+        self._offset = 0.0
+
+    @classmethod
+    def base(cls, dimensions, name):
+        return cls(1.0, dimensions, [name])
+
+    @classmethod
+    def from_unit(cls, unit, name):
+        if unit._offset:
+            return unit.derived(1.0, name)
+        return cls(unit._multiplier, unit._dimensions, [name])
+
+    @classmethod
+    def dimensionless(cls, dimension):
+        return cls(1.0, dimension ** 0, [_Dimensionless.DIMENSIONLESS])
+
+    def derived(self, relative_multiplier, name):
+        return self.__class__(
+            relative_multiplier * self._multiplier, self._dimensions, [name]
+        )
+
+    @property
+    def delta(self):
+        return self
+
+    def shifted(self, offset, name):
+        from .units import AffineUnit
+
+        return AffineUnit(
+            self._multiplier,
+            self._dimensions,
+            [name],
+            self._offset + offset * self._multiplier,
+        )
+
+    def to_str(self):
+        return "·".join(n for n in self._names if n is not _Dimensionless.DIMENSIONLESS)
+
+    def __repr__(self):
+        return self.to_str() or _Dimensionless.DIMENSIONLESS.value
+
+    def __mul__(self, other):
+        return Unit(
+            self._multiplier * other._multiplier,
+            self._dimensions * other._dimensions,
+            self._names + other._names,
+        )
+
+    def __rtruediv__(self, other):
+        # Assume other is a number
+        return Unit(
+            other / self._multiplier,
+            self._dimensions ** -1,
+            [f"{n}⁻¹" for n in self._names],
+        )
+
+    def __pow__(self, other):
+        return Unit(
+            self._multiplier ** other,
+            self._dimensions ** other,
+            [f"{n}{rational_exponent_str(other)}" for n in self._names],
+        )
+
+    def __truediv__(self, other):
+        return Unit(
+            self._multiplier / other._multiplier,
+            self._dimensions * other._dimensions ** -1,
+            self._names + [f"{n}{rational_exponent_str(-1)}" for n in other._names],
+        )
+
+    def __rlshift__(self, other):
+        # This implements number << unit for easy Quantity creation
+        if hasattr(other, "__len__"):
+            from .quantities import ArrayQuantity
+
+            return ArrayQuantity.from_list(other, self)
+        else:
+            from .quantities import ScalarQuantity
+
+            return ScalarQuantity(other, self)
+
+    def __eq__(self, other):
+        return (
+            (self._multiplier == other._multiplier)
+            and (self._dimensions == other._dimensions)
+            and (self._names == other._names)
+            and (self._offset == other._offset)
+        )
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import Any, Callable, Hashable, Union
+
+import numpy as np
+
+from .dimensions import Dimension
+from .quantities import ArrayQuantity, ScalarQuantity, _affine_kernel, _BaseQuantity
+from .units import IncommensurableUnitsError, Unit, affine_conversion
+
+_Spec = Union[Unit, Dimension]
+
+# Marks arguments that were not given, and parameters without a quantity as default
+_MISSING = object()
+
+
+def _wrap(value: Any, unit: Unit) -> _BaseQuantity:
+    if np.ndim(value) == 0:
+        return ScalarQuantity(value, unit)
+    else:
+        return ArrayQuantity(value, unit)
+
+
+def _unit_key(quantity: Any, name: str) -> Hashable:
+    # Units are usually rebuilt on every call (think of `m / s`),
+    # hence they are compared by value rather than by identity
+    if quantity is _MISSING:
+        return None
+
+    unit = getattr(quantity, "_unit", None)
+    if not isinstance(unit, Unit):
+        raise TypeError(f"Argument '{name}' must be a quantity")
+
+    dimensions = unit._dimensions
+    return (
+        unit._multiplier,
+        unit._offset,
+        tuple(dimensions._vector),
+        tuple(dimensions._base),
+    )
+
+
+def _conversion(quantity: Any, name: str, spec: _Spec) -> tuple[float, float]:
+    # Returns the scale and the shift, see affine_conversion
+    unit = quantity._unit  # type: Unit
+
+    # Arguments declared with a Dimension are only checked and passed as they are,
+    # arguments declared with a Unit are also converted to it
+    if isinstance(spec, Dimension):
+        if unit._dimensions != spec:
+            raise IncommensurableUnitsError(f"Incommensurable argument '{name}'")
+        return 1.0, 0.0
+    else:
+        if unit._dimensions != spec._dimensions:
+            raise IncommensurableUnitsError(f"Incommensurable argument '{name}'")
+        return affine_conversion(unit, spec)
+
+
+def _converted(value: Any, scale: float, shift: float) -> Any:
+    if shift:
+        return _affine_kernel(value, scale, shift)
+    elif scale != 1.0:
+        return scale * value
+    else:
+        return value
+
+
+def check_units(
+    returns: Unit | tuple[Unit, ...] | None = None, **arguments: _Spec
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        parameters = inspect.signature(func).parameters
+        positional_kinds = (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+
+        # Positional parameters always come first, so their index in the signature
+        # is also their index in `args`. Keyword-only parameters have no position
+        specs = []  # type: list[tuple[str, int | None, _Spec, Any]]
+        for name, spec in arguments.items():
+            if name not in parameters:
+                raise TypeError(f"{func.__name__}() has no argument '{name}'")
+
+            parameter = parameters[name]
+            if parameter.kind in positional_kinds:
+                position = list(parameters).index(name)  # type: int | None
+            elif parameter.kind is inspect.Parameter.KEYWORD_ONLY:
+                position = None
+            else:
+                raise TypeError(f"Cannot check units of variadic argument '{name}'")
+
+            # Quantities given as default values are converted once and for all,
+            # so that the function always receives values in the declared units
+            default = parameter.default
+            if isinstance(default, _BaseQuantity):
+                if parameter.kind is inspect.Parameter.POSITIONAL_ONLY:
+                    raise TypeError(
+                        f"Cannot check units of default value of '{name}', "
+                        "which is positional-only"
+                    )
+                default = _converted(default._value, *_conversion(default, name, spec))
+            else:
+                default = _MISSING
+
+            specs.append((name, position, spec, default))
+
+        # Conversion factors for each combination of argument units already seen
+        cache = {}  # type: dict[tuple[Hashable, ...], list[tuple[float, float]]]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            args_list = list(args)
+            quantities = []
+            for name, position, _, _ in specs:
+                if position is not None and position < len(args_list):
+                    quantities.append(args_list[position])
+                else:
+                    quantities.append(kwargs.get(name, _MISSING))
+
+            key = tuple(
+                _unit_key(q, name) for q, (name, _, _, _) in zip(quantities, specs)
+            )
+            try:
+                conversions = cache[key]
+            except KeyError:
+                conversions = [
+                    _conversion(q, name, spec) if q is not _MISSING else (1.0, 0.0)
+                    for q, (name, _, spec, _) in zip(quantities, specs)
+                ]
+                cache[key] = conversions
+
+            for q, (scale, shift), (name, position, _, default) in zip(
+                quantities, conversions, specs
+            ):
+                if q is _MISSING:
+                    # Other default values are left to the function
+                    if default is not _MISSING:
+                        kwargs[name] = default
+                    continue
+
+                value = _converted(q._value, scale, shift)
+                if position is not None and position < len(args_list):
+                    args_list[position] = value
+                else:
+                    kwargs[name] = value
+
+            result = func(*args_list, **kwargs)
+
+            if returns is None:
+                return result
+            elif isinstance(returns, tuple):
+                return tuple(_wrap(r, unit) for r, unit in zip(result, returns))
+            else:
+                return _wrap(result, returns)
+
+        return wrapper
+
+    return decorator
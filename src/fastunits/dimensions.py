@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence, Type, TypeVar
+from typing import TYPE_CHECKING, Sequence, Type, TypeVar
 
 import numpy as np
 from npytypes.rational import rational as R
@@ -56,3 +56,11 @@ class Dimension:
 
     def __eq__(self, other):
         return (self._vector == other._vector).all() and (self._base == other._base)
+
+
+# Use the compiled version if available, see setup.py
+if not TYPE_CHECKING:
+    try:
+        from ._dimensions import Dimension  # noqa: F811
+    except ImportError:  # pragma: no cover
+        pass
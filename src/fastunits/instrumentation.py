@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import functools
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator
+
+from . import is_compiled
+from .dimensions import Dimension
+from .quantities import _BaseQuantity
+from .units import Unit
+
+# Hot methods that can be instrumented.
+# Instead of checking a flag on every call, which would have a cost
+# even when instrumentation is disabled, these methods are replaced
+# by counting wrappers on `enable` and restored on `disable`.
+# Hence this is not available when using the compiled classes,
+# whose methods cannot be replaced
+_TARGETS = [
+    (Dimension, "__init__"),
+    (Dimension, "__mul__"),
+    (Dimension, "__pow__"),
+    (Unit, "__init__"),
+    (Unit, "__mul__"),
+    (Unit, "__truediv__"),
+    (Unit, "__rtruediv__"),
+    (Unit, "__pow__"),
+    (_BaseQuantity, "__init__"),
+    (_BaseQuantity, "to_value"),
+]  # type: list[tuple[type, str]]
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.total_time_ns = 0
+        # Durations are grouped in power of two buckets,
+        # the key being the bit length of the duration in nanoseconds
+        self.histogram = {}  # type: dict[int, int]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time_ns * 1e-9,
+            "histogram": {
+                2 ** bucket: count for bucket, count in sorted(self.histogram.items())
+            },
+        }
+
+
+_counters = {}  # type: dict[str, _Counter]
+_originals = {}  # type: dict[tuple[type, str], Callable[..., Any]]
+
+
+def _counting(func: Callable[..., Any], counter: _Counter) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        counter.calls += 1
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _timing(func: Callable[..., Any], counter: _Counter) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # Times are inclusive of the instrumented calls made inside
+            elapsed = perf_counter_ns() - start
+            counter.calls += 1
+            counter.total_time_ns += elapsed
+            bucket = elapsed.bit_length()
+            counter.histogram[bucket] = counter.histogram.get(bucket, 0) + 1
+
+    return wrapper
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable(timing: bool = False) -> None:
+    if is_enabled():
+        raise RuntimeError("Instrumentation is already enabled")
+    if is_compiled():
+        raise RuntimeError("Instrumentation is not available with compiled classes")
+
+    wrap = _timing if timing else _counting
+    for cls, name in _TARGETS:
+        key = f"{cls.__name__}.{name}"
+        counter = _counters.setdefault(key, _Counter())
+        original = cls.__dict__[name]
+        _originals[(cls, name)] = original
+        setattr(cls, name, wrap(original, counter))
+
+
+def disable() -> None:
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+
+def reset() -> None:
+    # Counters are reset in place, since the wrappers hold references to them
+    for counter in _counters.values():
+        counter.reset()
+
+
+def stats() -> dict[str, dict[str, Any]]:
+    return {key: counter.snapshot() for key, counter in sorted(_counters.items())}
+
+
+@contextmanager
+def instrumented(timing: bool = False) -> Iterator[None]:
+    enable(timing=timing)
+    try:
+        yield
+    finally:
+        disable()
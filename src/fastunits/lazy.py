@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import numpy as np
+
+from .quantities import ArrayQuantity, ScalarQuantity, _BaseQuantity
+from .units import AffineUnitsError, IncommensurableUnitsError, Unit
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover
+    numexpr = None
+
+# Number of elements processed at once by the NumPy backend,
+# which bounds the size of the temporaries created during evaluation
+DEFAULT_BLOCK_SIZE = 8192
+
+_UFUNCS: dict[str, Callable[..., Any]] = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": np.divide,
+}
+
+
+# Expression trees only hold plain values and numbers:
+# all the unit algebra happens when the tree is built,
+# so that evaluation only has to deal with the arithmetic
+class _Node:
+    pass
+
+
+class _Operand(_Node):
+    def __init__(self, index: int):
+        self.index = index
+
+
+class _Scale(_Node):
+    def __init__(self, factor: float, node: _Node):
+        self.factor = factor
+        self.node = node
+
+
+class _BinaryOp(_Node):
+    def __init__(self, op: str, left: _Node, right: _Node):
+        self.op = op
+        self.left = left
+        self.right = right
+
+
+def _scale(factor: float, node: _Node) -> _Node:
+    # Conversion factors are folded together, and unitary ones dropped,
+    # so that each operand is multiplied at most once
+    if isinstance(node, _Scale):
+        return _scale(factor * node.factor, node.node)
+    elif factor == 1.0:
+        return node
+    else:
+        return _Scale(factor, node)
+
+
+def _reindex(node: _Node, offset: int) -> _Node:
+    if isinstance(node, _Operand):
+        return _Operand(node.index + offset)
+    elif isinstance(node, _Scale):
+        return _Scale(node.factor, _reindex(node.node, offset))
+    elif isinstance(node, _BinaryOp):
+        return _BinaryOp(
+            node.op, _reindex(node.left, offset), _reindex(node.right, offset)
+        )
+    else:  # pragma: no cover
+        raise TypeError(f"Unknown node {node!r}")
+
+
+def _to_str(node: _Node) -> str:
+    if isinstance(node, _Operand):
+        return f"v{node.index}"
+    elif isinstance(node, _Scale):
+        return f"({node.factor!r} * {_to_str(node.node)})"
+    elif isinstance(node, _BinaryOp):
+        return f"({_to_str(node.left)} {node.op} {_to_str(node.right)})"
+    else:  # pragma: no cover
+        raise TypeError(f"Unknown node {node!r}")
+
+
+def _output_buffer(value: Any, owned: bool, dtype: Any) -> Any:
+    # Temporaries can only hold the result of the parent operation
+    # if it has the same dtype, which is not the case when it needs
+    # a wider one (for example, integers scaled by a conversion factor)
+    if owned and isinstance(value, np.ndarray) and value.dtype == dtype:
+        return value
+    return None
+
+
+def _evaluate_block(node: _Node, inputs: list[Any]) -> tuple[Any, bool]:
+    # Returns the result and whether it is a temporary we own,
+    # in which case it can be reused as output buffer by the parent operation
+    if isinstance(node, _Operand):
+        return inputs[node.index], False
+    elif isinstance(node, _Scale):
+        value, owned = _evaluate_block(node.node, inputs)
+        out = _output_buffer(value, owned, np.result_type(value, node.factor))
+        return np.multiply(value, node.factor, out=out), True
+    elif isinstance(node, _BinaryOp):
+        left, left_owned = _evaluate_block(node.left, inputs)
+        right, right_owned = _evaluate_block(node.right, inputs)
+        if node.op == "/":
+            # True division of integers gives floats
+            dtype = np.result_type(left, right, 1.0)
+        else:
+            dtype = np.result_type(left, right)
+        out = _output_buffer(left, left_owned, dtype)
+        if out is None:
+            out = _output_buffer(right, right_owned, dtype)
+        return _UFUNCS[node.op](left, right, out=out), True
+    else:  # pragma: no cover
+        raise TypeError(f"Unknown node {node!r}")
+
+
+# Deferred quantity: operations build an expression tree
+# and nothing is computed until `evaluate` is called
+class LazyQuantity:
+    def __init__(self, node: _Node, values: list[Any], unit: Unit):
+        self._node = node
+        self._values = values
+        self._unit = unit
+
+    @classmethod
+    def from_quantity(cls, quantity: _BaseQuantity) -> LazyQuantity:
+        return cls(_Operand(0), [quantity._value], quantity._unit)
+
+    @property
+    def unit(self) -> Unit:
+        return self._unit
+
+    def __repr__(self):
+        return f"LazyQuantity({_to_str(self._node)}, {self._unit!r})"
+
+    def _combine(
+        self, op: str, other: LazyQuantity, unit: Unit, factor: float = 1.0
+    ) -> LazyQuantity:
+        right = _scale(factor, _reindex(other._node, len(self._values)))
+        return LazyQuantity(
+            _BinaryOp(op, self._node, right), self._values + other._values, unit
+        )
+
+    def _add_or_sub(self, op: str, other: LazyQuantity | _BaseQuantity) -> LazyQuantity:
+        other = lazy(other)
+        if other._unit._dimensions != self._unit._dimensions:
+            raise IncommensurableUnitsError("Incommensurable quantities")
+
+        # Same rules as eager quantities: absolute values can only be
+        # added to differences, and the result keeps the absolute unit
+        if self._unit._offset and other._unit._offset:
+            raise AffineUnitsError("Cannot add two quantities with offset units")
+        elif other._unit._offset:
+            if op == "-":
+                raise AffineUnitsError("Cannot subtract a quantity with offset units")
+            return other._add_or_sub(op, self)
+
+        # For absolute values, the difference is expressed in their delta unit,
+        # which has the same multiplier
+        factor = other._unit._multiplier / self._unit._multiplier
+        return self._combine(op, other, self._unit, factor)
+
+    def __add__(self, other):
+        if not isinstance(other, _OPERANDS):
+            return NotImplemented
+        return self._add_or_sub("+", other)
+
+    def __sub__(self, other):
+        if not isinstance(other, _OPERANDS):
+            return NotImplemented
+        return self._add_or_sub("-", other)
+
+    def __mul__(self, other):
+        if not isinstance(other, _OPERANDS):
+            return NotImplemented
+        other = lazy(other)
+        return self._combine("*", other, self._unit * other._unit)
+
+    def __rmul__(self, other):
+        if isinstance(other, _BaseQuantity):
+            return lazy(other) * self
+
+        # Assume other is a number
+        if self._unit._offset:
+            raise AffineUnitsError("Cannot multiply a quantity with offset units")
+        return LazyQuantity(_scale(other, self._node), self._values, self._unit)
+
+    def __truediv__(self, other):
+        if not isinstance(other, _OPERANDS):
+            return NotImplemented
+        other = lazy(other)
+        return self._combine("/", other, self._unit / other._unit)
+
+    # Quantities return NotImplemented when operated with lazy ones,
+    # so these take care of lazy values on the right
+    def __radd__(self, other):
+        if not isinstance(other, _BaseQuantity):
+            return NotImplemented
+        return lazy(other) + self
+
+    def __rsub__(self, other):
+        if not isinstance(other, _BaseQuantity):
+            return NotImplemented
+        return lazy(other) - self
+
+    def __rtruediv__(self, other):
+        if not isinstance(other, _BaseQuantity):
+            return NotImplemented
+        return lazy(other) / self
+
+    def _result_dtype(self) -> Any:
+        # Evaluating the expression on one element arrays
+        # gives the same dtype as eager evaluation, whatever the backend
+        samples = [
+            np.ones(1, dtype=value.dtype) if isinstance(value, np.ndarray) else value
+            for value in self._values
+        ]
+        result, _ = _evaluate_block(self._node, samples)
+        return np.asarray(result).dtype
+
+    def _evaluate_numpy(self, block_size: int) -> Any:
+        dtype = self._result_dtype()
+        # Per operand flags, which NumPy stubs do not describe well
+        op_flags = [["readonly"]] * len(self._values) + [
+            ["writeonly", "allocate"]
+        ]  # type: Any
+        iterator = np.nditer(
+            self._values + [None],
+            flags=["external_loop", "buffered", "zerosize_ok"],
+            op_flags=op_flags,
+            op_dtypes=[dtype] * (len(self._values) + 1),
+            buffersize=block_size,
+        )
+        with iterator:
+            for *inputs, out in iterator:
+                out[...], _ = _evaluate_block(self._node, inputs)
+            return iterator.operands[-1]
+
+    def _evaluate_numexpr(self) -> Any:
+        local_dict = {f"v{index}": value for index, value in enumerate(self._values)}
+        value = numexpr.evaluate(_to_str(self._node), local_dict=local_dict)
+        return value.astype(self._result_dtype(), copy=False)
+
+    def evaluate(
+        self, backend: str | None = None, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> _BaseQuantity:
+        if backend is None:
+            backend = "numpy" if numexpr is None else "numexpr"
+
+        if backend == "numexpr":
+            if numexpr is None:
+                raise ImportError("The numexpr backend requires numexpr")
+            value = self._evaluate_numexpr()
+        elif backend == "numpy":
+            value = self._evaluate_numpy(block_size)
+        else:
+            raise ValueError(f"Unknown backend {backend!r}")
+
+        if np.ndim(value) == 0 and all(np.ndim(v) == 0 for v in self._values):
+            # Like eager operations, this gives back Python numbers
+            return ScalarQuantity(value.item(), self._unit)
+        else:
+            return ArrayQuantity(value, self._unit)
+
+
+def lazy(quantity: Any) -> LazyQuantity:
+    if isinstance(quantity, LazyQuantity):
+        return quantity
+    elif isinstance(quantity, _BaseQuantity):
+        return LazyQuantity.from_quantity(quantity)
+    else:
+        raise TypeError(f"Cannot build a lazy quantity from {quantity!r}")
+
+
+# Operands supported by the arithmetic operators of lazy quantities
+_OPERANDS = (LazyQuantity, _BaseQuantity)
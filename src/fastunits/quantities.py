@@ -1,15 +1,39 @@
 from __future__ import annotations
 
-from typing import Any, Sequence, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Sequence, Type, TypeVar
 
 import numpy as np
 from numpy.typing import NBitBase, NDArray
 
-from .units import IncommensurableUnitsError, Unit
+from .units import AffineUnitsError, IncommensurableUnitsError, Unit, affine_conversion
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover
+    numexpr = None
 
 _T = TypeVar("_T", bound="_BaseQuantity")
 
 
+def _affine_kernel(value: Any, scale: float, shift: float) -> Any:
+    # Computes `scale * value + shift` in a single pass over arrays
+    # when numexpr is available, or with a single temporary otherwise
+    if not isinstance(value, np.ndarray):
+        return scale * value + shift
+    elif numexpr is not None:
+        # numexpr computes in double precision,
+        # so the result is cast back to the dtype NumPy would give
+        result = numexpr.evaluate(
+            "scale * value + shift",
+            local_dict={"scale": scale, "value": value, "shift": shift},
+        )
+        return result.astype(np.result_type(value, scale, shift), copy=False)
+    else:
+        result = np.multiply(value, scale)
+        result += shift
+        return result
+
+
 # Each quantity is a value with a unit
 class _BaseQuantity:
     def __init__(self, value: Any, unit: Unit):
@@ -25,35 +49,57 @@ class _BaseQuantity:
         return f"{self._value} {suffix}" if suffix else f"{self._value}"
 
     def __mul__(self, other):
+        if not isinstance(other, _BaseQuantity):
+            return NotImplemented
+
         return self.__class__(self._value * other._value, self._unit * other._unit)
 
     def __rmul__(self, other):
         # Assume other is a number
+        if self._unit._offset:
+            raise AffineUnitsError("Cannot multiply a quantity with offset units")
         return self.__class__(self._value * other, self._unit)
 
     def __add__(self, other):
+        if not isinstance(other, _BaseQuantity):
+            return NotImplemented
+
+        if self._unit._offset or other._unit._offset:
+            return self._add_affine(other)
+
         # The line below will fail if the magnitudes are incommensurable
         other_converted_value = other.to_value(self._unit)
         return self.__class__(self._value + other_converted_value, self._unit)
 
+    def _add_affine(self, other: _BaseQuantity) -> _BaseQuantity:
+        # Absolute values can only be added to differences
+        if self._unit._offset and other._unit._offset:
+            raise AffineUnitsError("Cannot add two quantities with offset units")
+        elif other._unit._offset:
+            return other._add_affine(self)
+
+        other_converted_value = other.to_value(self._unit.delta)
+        return self.__class__(self._value + other_converted_value, self._unit)
+
     def to_value(self, unit: Unit) -> Any:
         if unit._dimensions != self._unit._dimensions:
             raise IncommensurableUnitsError("Incommensurable quantities")
 
-        # TODO: Move multiplicative factor logic to Unit class,
-        # so that more complex logic can be implemented?
-        # However, that would create another layer of indirection
-        # (possibly with a small impact in performance)
-        # only to support non-multiplicative units
-        # like temperature scales (Celsius, Fahrenheit, and the like)
-        return (self._unit._multiplier / unit._multiplier) * self._value
+        # Purely multiplicative units, by far the most common ones,
+        # only need one multiplication.
+        # Units with offsets (see AffineUnit) go through a separate path
+        # so that they do not slow down the rest
+        if not (self._unit._offset or unit._offset):
+            return (self._unit._multiplier / unit._multiplier) * self._value
+
+        return _affine_kernel(self._value, *affine_conversion(self._unit, unit))
 
     def to(self: _T, unit: Unit) -> _T:
         return self.__class__(self.to_value(unit), unit)
 
 
 class ScalarQuantity(_BaseQuantity):
-    def __init__(self, value: float, unit: Unit):
+    def __init__(self, value: complex, unit: Unit):
         super().__init__(value, unit)
 
     def __eq__(self, other):
@@ -63,6 +109,14 @@ class ScalarQuantity(_BaseQuantity):
         return bool((self.unit == other.unit) and (self._value == other._value))
 
 
+# Use the compiled versions if available, see setup.py
+if not TYPE_CHECKING:
+    try:
+        from ._quantities import ScalarQuantity, _BaseQuantity  # noqa: F401,F811
+    except ImportError:  # pragma: no cover
+        pass
+
+
 _TA = TypeVar("_TA", bound="ArrayQuantity")
 _P = TypeVar("_P", bound=NBitBase)
 
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .dimensions import Dimension, SI_base, dimensions_from_base
+from .quantities import _affine_kernel, _BaseQuantity
+from .units import AffineUnitsError, IncommensurableUnitsError, Unit, affine_conversion
+
+_Definitions = Callable[["UnitSystem"], Mapping[str, Unit]]
+_Table = NDArray[Any]
+
+
+# A unit system groups a set of units built on the same dimensions
+# together with the values of the constants used to define them,
+# so that different releases of the constants can coexist
+class UnitSystem:
+    def __init__(
+        self,
+        name: str,
+        base: Sequence[str],
+        constants: Mapping[str, float],
+        definitions: _Definitions,
+    ):
+        self.name = name
+        self.base = base
+        self.constants = dict(constants)
+        self._definitions = definitions
+
+        # The registry and the conversion tables are only built when needed
+        self._dimensions = None  # type: tuple[Dimension, ...] | None
+        self._units = None  # type: dict[str, Unit] | None
+        self._indices = {}  # type: dict[int, int]
+        self._tables = {}  # type: dict[int, tuple[UnitSystem, _Table, _Table]]
+
+    def __repr__(self):
+        return f"UnitSystem({self.name!r})"
+
+    @property
+    def dimensions(self) -> tuple[Dimension, ...]:
+        if self._dimensions is None:
+            self._dimensions = dimensions_from_base(self.base)
+        return self._dimensions
+
+    @property
+    def units(self) -> dict[str, Unit]:
+        if self._units is None:
+            self._units = dict(self._definitions(self))
+            self._indices = {
+                id(unit): index for index, unit in enumerate(self._units.values())
+            }
+            # Conversions within the system are the most common ones,
+            # so their table is computed upfront
+            self._tables_for(self)
+        return self._units
+
+    def __getitem__(self, name: str) -> Unit:
+        return self.units[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.units
+
+    def _tables_for(self, source: UnitSystem) -> tuple[_Table, _Table]:
+        # Elements [i, j] of the tables are the scale and the shift
+        # that convert values from the i-th unit of `source`
+        # to the j-th unit of this system (see affine_conversion),
+        # and the scale is NaN if the units are incommensurable
+        try:
+            _, scales, shifts = self._tables[id(source)]
+            return scales, shifts
+        except KeyError:
+            pass
+
+        if tuple(source.base) != tuple(self.base):
+            raise ValueError(f"{source!r} and {self!r} have different bases")
+
+        source_units = list(source.units.values())
+        target_units = list(self.units.values())
+
+        source_multipliers = np.array([u._multiplier for u in source_units])
+        target_multipliers = np.array([u._multiplier for u in target_units])
+        scales = np.divide.outer(source_multipliers, target_multipliers)
+
+        source_offsets = np.array([u._offset for u in source_units])
+        target_offsets = np.array([u._offset for u in target_units])
+        shifts = (
+            np.subtract.outer(source_offsets, target_offsets)
+            / target_multipliers[None, :]
+        )
+
+        source_vectors = np.stack([u._dimensions._vector for u in source_units])
+        target_vectors = np.stack([u._dimensions._vector for u in target_units])
+        same_dimensions = source_vectors[:, None, :] == target_vectors[None, :, :]
+        scales[~same_dimensions.all(axis=-1)] = np.nan
+
+        # The source system is stored too, to keep its id from being reused
+        self._tables[id(source)] = (source, scales, shifts)
+        return scales, shifts
+
+    def conversion(
+        self, from_unit: Unit, to_unit: Unit, source: UnitSystem | None = None
+    ) -> tuple[float, float]:
+        # Returns the scale and the shift, see affine_conversion
+        if source is None:
+            source = self
+
+        # This builds both registries if needed
+        scales, shifts = self._tables_for(source)
+        try:
+            row = source._indices[id(from_unit)]
+            column = self._indices[id(to_unit)]
+        except KeyError:
+            # Units outside of the registries (for example, composite units
+            # created on the fly) are converted using their multipliers and offsets
+            if from_unit._dimensions != to_unit._dimensions:
+                raise IncommensurableUnitsError("Incommensurable quantities")
+            return affine_conversion(from_unit, to_unit)
+
+        scale = float(scales[row, column])
+        if scale != scale:
+            raise IncommensurableUnitsError("Incommensurable quantities")
+        return scale, float(shifts[row, column])
+
+    def conversion_factor(
+        self, from_unit: Unit, to_unit: Unit, source: UnitSystem | None = None
+    ) -> float:
+        scale, shift = self.conversion(from_unit, to_unit, source)
+        if shift:
+            raise AffineUnitsError(
+                "Conversion between units with offset is not a factor"
+            )
+        return scale
+
+    def to_value(
+        self,
+        quantity: _BaseQuantity,
+        unit: Unit | str,
+        source: UnitSystem | None = None,
+    ) -> Any:
+        if isinstance(unit, str):
+            unit = self[unit]
+
+        scale, shift = self.conversion(quantity._unit, unit, source)
+        if shift:
+            return _affine_kernel(quantity._value, scale, shift)
+        return scale * quantity._value
+
+    def convert(
+        self,
+        quantity: _BaseQuantity,
+        unit: Unit | str,
+        source: UnitSystem | None = None,
+    ) -> _BaseQuantity:
+        if isinstance(unit, str):
+            unit = self[unit]
+        return quantity.__class__(self.to_value(quantity, unit, source), unit)
+
+
+def _si_definitions(system: UnitSystem) -> dict[str, Unit]:
+    time, length, mass, current, temperature, amount, intensity = system.dimensions
+    constants = system.constants
+
+    s = Unit.base(time, "s")
+    m = Unit.base(length, "m")
+    kg = Unit.base(mass, "kg")
+    A = Unit.base(current, "A")
+    K = Unit.base(temperature, "K")
+    mol = Unit.base(amount, "mol")
+    cd = Unit.base(intensity, "cd")
+
+    joule = Unit.from_unit(kg * m ** 2 / s ** 2, "J")
+
+    units = [
+        s,
+        m,
+        m.derived(1e-2, "cm"),
+        m.derived(1e3, "km"),
+        kg,
+        kg.derived(1e-3, "g"),
+        A,
+        K,
+        K.shifted(273.15, "°C"),
+        mol,
+        cd,
+        Unit.from_unit(kg * m / s ** 2, "N"),
+        joule,
+        Unit.from_unit(A * s, "C"),
+        joule.derived(constants["elementary_charge"], "eV"),
+        joule.derived(constants["hartree_energy"], "Eₕ"),
+        m.derived(constants["bohr_radius"], "a₀"),
+        kg.derived(constants["atomic_mass_constant"], "u"),
+    ]
+    return {unit.to_str(): unit for unit in units}
+
+
+CODATA2014 = UnitSystem(
+    "CODATA 2014",
+    SI_base,
+    constants={
+        "elementary_charge": 1.6021766208e-19,
+        "hartree_energy": 4.359744650e-18,
+        "bohr_radius": 0.52917721067e-10,
+        "atomic_mass_constant": 1.660539040e-27,
+    },
+    definitions=_si_definitions,
+)
+
+CODATA2018 = UnitSystem(
+    "CODATA 2018",
+    SI_base,
+    constants={
+        "elementary_charge": 1.602176634e-19,
+        "hartree_energy": 4.3597447222071e-18,
+        "bohr_radius": 0.529177210903e-10,
+        "atomic_mass_constant": 1.66053906660e-27,
+    },
+    definitions=_si_definitions,
+)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Type, TypeVar
+from typing import TYPE_CHECKING, Type, TypeVar
 
 from .dimensions import Dimension
 from .printing import rational_exponent_str
@@ -13,6 +13,10 @@ class IncommensurableUnitsError(ValueError):
     pass
 
 
+class AffineUnitsError(ValueError):
+    pass
+
+
 # The closest thing to a "sentinel value" supported by Python and MyPy
 class _Dimensionless(Enum):
     DIMENSIONLESS = "(dimensionless)"
@@ -24,6 +28,10 @@ class _Dimensionless(Enum):
 # Notice that we use the same class for simple units and for composite units
 class Unit:
 
+    # Purely multiplicative units have no offset,
+    # see AffineUnit for the ones that do
+    _offset = 0.0
+
     # Trick to make `np.array([...]) << unit` work,
     # borrowed from https://github.com/astropy/astropy/blob/d1e122d/\
     # astropy/units/core.py#L630-L632
@@ -49,6 +57,9 @@ class Unit:
 
     @classmethod
     def from_unit(cls: Type[_U], unit: _U, name: str) -> _U:
+        # Units with offset keep it, otherwise values would be converted wrongly
+        if unit._offset:
+            return unit.derived(1.0, name)
         return cls(unit._multiplier, unit._dimensions, [name])
 
     @classmethod
@@ -60,6 +71,21 @@ class Unit:
             relative_multiplier * self._multiplier, self._dimensions, [name]
         )
 
+    @property
+    def delta(self) -> Unit:
+        # Differences in purely multiplicative units use the same unit
+        return self
+
+    def shifted(self, offset: float, name: str) -> AffineUnit:
+        # The offset is expressed in this unit,
+        # for example `K.shifted(273.15, "°C")`
+        return AffineUnit(
+            self._multiplier,
+            self._dimensions,
+            [name],
+            self._offset + offset * self._multiplier,
+        )
+
     def to_str(self) -> str:
         return "·".join(n for n in self._names if n is not _Dimensionless.DIMENSIONLESS)
 
@@ -115,4 +141,69 @@ class Unit:
             (self._multiplier == other._multiplier)
             and (self._dimensions == other._dimensions)
             and (self._names == other._names)
+            and (self._offset == other._offset)
         )
+
+
+# Use the compiled version if available, see setup.py
+if not TYPE_CHECKING:
+    try:
+        from ._units import Unit  # noqa: F811
+    except ImportError:  # pragma: no cover
+        pass
+
+
+def affine_conversion(from_unit: Unit, to_unit: Unit) -> tuple[float, float]:
+    # Returns the scale and the shift that convert values
+    # from `from_unit` to `to_unit` as `scale * value + shift`
+    scale = from_unit._multiplier / to_unit._multiplier
+    shift = (from_unit._offset - to_unit._offset) / to_unit._multiplier
+    return scale, shift
+
+
+# Units with an offset, like temperature scales (Celsius, Fahrenheit, and the like).
+# Values in these units are absolute: they can be converted to other units
+# and can be added to differences (see `delta`), but they cannot be
+# multiplied, divided or added together
+class AffineUnit(Unit):
+    def __init__(
+        self,
+        multiplier: float,
+        dimensions: Dimension,
+        names: list[str | _Dimensionless],
+        offset: float,
+    ):
+        super().__init__(multiplier, dimensions, names)
+        # The offset is expressed in base units
+        self._offset = offset
+
+    @property
+    def delta(self) -> Unit:
+        # Differences of absolute values are purely multiplicative
+        return Unit(self._multiplier, self._dimensions, [f"Δ{self.to_str()}"])
+
+    def derived(self, relative_multiplier: float, name: str) -> AffineUnit:
+        return AffineUnit(
+            relative_multiplier * self._multiplier,
+            self._dimensions,
+            [name],
+            self._offset,
+        )
+
+    def _invalid_operation(self) -> AffineUnitsError:
+        return AffineUnitsError(f"Invalid operation on unit with offset {self}")
+
+    def __mul__(self, other):
+        raise self._invalid_operation()
+
+    def __rmul__(self, other):
+        raise self._invalid_operation()
+
+    def __truediv__(self, other):
+        raise self._invalid_operation()
+
+    def __rtruediv__(self, other):
+        raise self._invalid_operation()
+
+    def __pow__(self, other):
+        raise self._invalid_operation()
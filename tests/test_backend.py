@@ -0,0 +1,16 @@
+import os
+
+import pytest
+
+import fastunits
+
+
+# The test suite is run against both the pure Python and the compiled modules,
+# see the `compiled` factor in tox.ini
+@pytest.mark.skipif(
+    "FASTUNITS_CYTHONIZE" not in os.environ, reason="Backend not specified"
+)
+def test_backend_matches_build_configuration():
+    expected = os.environ["FASTUNITS_CYTHONIZE"] == "1"
+
+    assert fastunits.is_compiled() is expected
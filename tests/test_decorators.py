@@ -0,0 +1,207 @@
+import numpy as np
+import pytest
+
+from fastunits import decorators
+from fastunits.decorators import _conversion, check_units
+from fastunits.dimensions import dimensions_from_base
+from fastunits.quantities import ArrayQuantity, ScalarQuantity
+from fastunits.units import IncommensurableUnitsError, Unit
+
+
+@pytest.fixture
+def units():
+    T, L = dimensions_from_base("TL")
+    s = Unit.base(T, "s")
+    m = Unit.base(L, "m")
+    km = m.derived(1000.0, "km")
+
+    return s, m, km
+
+
+def test_check_units_converts_arguments_and_attaches_result_unit(units):
+    s, m, km = units
+
+    @check_units(distance=m, time=s, returns=m / s)
+    def speed(distance, time):
+        assert isinstance(distance, float)
+        return distance / time
+
+    expected_quantity = ScalarQuantity(500.0, m / s)
+
+    result = speed(1.0 << km, 2.0 << s)
+
+    assert result == expected_quantity
+
+
+def test_check_units_supports_keyword_arguments_and_arrays(units):
+    s, m, km = units
+
+    @check_units(distance=m, time=s, returns=m / s)
+    def speed(distance, time):
+        return distance / time
+
+    expected_quantity = ArrayQuantity.from_list([1.0, 2.0], m / s)
+
+    result = speed(time=[1.0, 1.0] << s, distance=[1.0, 2.0] << m)
+
+    assert isinstance(result, ArrayQuantity)
+    assert result.equals_exact(expected_quantity)
+
+
+def test_check_units_handles_different_units_on_later_calls(units):
+    s, m, km = units
+
+    @check_units(distance=m)
+    def raw(distance):
+        return distance
+
+    assert raw(2.0 << m) == 2.0
+    assert raw(2.0 << km) == 2000.0
+    assert raw(3.0 << m) == 3.0
+
+
+def test_check_units_dimension_only_checks_argument(units):
+    s, m, km = units
+    L = m._dimensions
+
+    @check_units(distance=L)
+    def raw(distance):
+        return distance
+
+    assert raw(2.0 << km) == 2.0
+
+
+def test_check_units_returns_tuple_of_quantities(units):
+    s, m, km = units
+
+    @check_units(distance=m, returns=(m, km))
+    def split(distance):
+        return distance, distance / 1000
+
+    d_m, d_km = split(np.array([1000.0, 2000.0]) << m)
+
+    assert d_m.equals_exact(ArrayQuantity.from_list([1000.0, 2000.0], m))
+    assert d_km.equals_exact(ArrayQuantity.from_list([1.0, 2.0], km))
+
+
+def test_check_units_incommensurable_argument_raises_error(units):
+    s, m, km = units
+
+    @check_units(distance=m)
+    def raw(distance):
+        return distance
+
+    with pytest.raises(IncommensurableUnitsError, match="'distance'"):
+        raw(1.0 << s)
+
+
+def test_check_units_plain_number_raises_error(units):
+    s, m, km = units
+
+    @check_units(distance=m)
+    def raw(distance):
+        return distance
+
+    with pytest.raises(TypeError, match="must be a quantity"):
+        raw(1.0)
+
+
+def test_check_units_unknown_argument_raises_error(units):
+    s, m, km = units
+
+    with pytest.raises(TypeError, match="no argument 'time'"):
+
+        @check_units(time=s)
+        def raw(distance):
+            return distance
+
+
+def test_check_units_uses_default_values(units):
+    s, m, km = units
+
+    @check_units(distance=m, time=s)
+    def raw(distance, time=None):
+        return time
+
+    assert raw(1.0 << m) is None
+    assert raw(1.0 << m, 2.0 << s) == 2.0
+
+
+def test_check_units_converts_quantity_default_values(units):
+    s, m, km = units
+
+    @check_units(distance=m, time=s)
+    def raw(distance, *, time=2.0 << s):
+        return distance, time
+
+    @check_units(distance=km)
+    def raw_km(distance=1.0 << m):
+        return distance
+
+    assert raw(1.0 << m) == (1.0, 2.0)
+    assert raw(1.0 << m, time=3.0 << s) == (1.0, 3.0)
+    assert raw_km() == 1e-3
+
+
+def test_check_units_incommensurable_default_value_raises_error(units):
+    s, m, km = units
+
+    with pytest.raises(IncommensurableUnitsError, match="argument 'time'"):
+
+        @check_units(time=s)
+        def raw(time=1.0 << m):
+            return time
+
+
+def test_check_units_caches_equal_units_built_on_each_call(units, monkeypatch):
+    s, m, km = units
+    calls = []
+
+    def conversion(quantity, name, spec):
+        calls.append(name)
+        return _conversion(quantity, name, spec)
+
+    monkeypatch.setattr(decorators, "_conversion", conversion)
+
+    @check_units(speed=m / s)
+    def raw(speed):
+        return speed
+
+    for _ in range(10):
+        # The unit is a different, but equal, object on each call
+        assert raw(1.0 << km / s) == 1000.0
+
+    assert calls == ["speed"]
+
+
+def test_check_units_supports_keyword_only_arguments(units):
+    s, m, km = units
+
+    @check_units(distance=m)
+    def raw(*args, distance):
+        return args, distance
+
+    assert raw(1, 2, distance=1.0 << km) == ((1, 2), 1000.0)
+
+
+def test_check_units_variadic_argument_raises_error(units):
+    s, m, km = units
+
+    with pytest.raises(TypeError, match="variadic argument 'args'"):
+
+        @check_units(args=m)
+        def raw(*args):
+            return args
+
+
+def test_check_units_converts_units_with_offset(units):
+    s, m, km = units
+    K = Unit.base(s._dimensions, "K")
+    degC = K.shifted(273.15, "°C")
+
+    @check_units(t=K)
+    def raw(t):
+        return t
+
+    assert raw(20.0 << degC) == pytest.approx(293.15)
+    assert raw(np.array([20.0, 30.0]) << degC) == pytest.approx([293.15, 303.15])
@@ -0,0 +1,98 @@
+import pytest
+
+from fastunits import instrumentation, is_compiled
+from fastunits.dimensions import Dimension
+from fastunits.quantities import ScalarQuantity
+from fastunits.units import Unit
+
+requires_pure_python = pytest.mark.skipif(
+    is_compiled(), reason="Instrumentation requires the pure Python classes"
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+@requires_pure_python
+def test_instrumented_counts_calls(dimension):
+    unit = Unit.base(dimension, "a")
+    q = ScalarQuantity(1.0, unit)
+
+    with instrumentation.instrumented():
+        unit * unit
+        q.to_value(unit)
+        ScalarQuantity(2.0, unit)
+
+    stats = instrumentation.stats()
+
+    assert stats["Unit.__mul__"]["calls"] == 1
+    assert stats["Unit.__init__"]["calls"] == 1
+    assert stats["Dimension.__mul__"]["calls"] == 1
+    assert stats["Dimension.__init__"]["calls"] == 1
+    assert stats["_BaseQuantity.to_value"]["calls"] == 1
+    assert stats["_BaseQuantity.__init__"]["calls"] == 1
+    assert stats["Unit.__pow__"]["calls"] == 0
+
+
+@requires_pure_python
+def test_instrumented_restores_original_methods():
+    original = Dimension.__mul__
+
+    with instrumentation.instrumented():
+        assert Dimension.__mul__ is not original
+        assert instrumentation.is_enabled()
+
+    assert Dimension.__mul__ is original
+    assert not instrumentation.is_enabled()
+
+
+@requires_pure_python
+def test_calls_are_not_counted_when_disabled(dimension):
+    with instrumentation.instrumented():
+        pass
+
+    dimension * dimension
+
+    assert instrumentation.stats()["Dimension.__mul__"]["calls"] == 0
+
+
+@requires_pure_python
+def test_instrumented_with_timing_fills_histogram(dimension):
+    with instrumentation.instrumented(timing=True):
+        dimension ** 2
+        dimension ** 3
+
+    stats = instrumentation.stats()["Dimension.__pow__"]
+
+    assert stats["calls"] == 2
+    assert stats["total_time"] > 0
+    assert sum(stats["histogram"].values()) == 2
+
+
+@requires_pure_python
+def test_reset_while_enabled_keeps_counting(dimension):
+    with instrumentation.instrumented():
+        dimension * dimension
+        instrumentation.reset()
+        dimension * dimension
+
+    assert instrumentation.stats()["Dimension.__mul__"]["calls"] == 1
+
+
+@requires_pure_python
+def test_enable_twice_raises_error():
+    instrumentation.enable()
+
+    with pytest.raises(RuntimeError, match="already enabled"):
+        instrumentation.enable()
+
+
+@pytest.mark.skipif(not is_compiled(), reason="Requires the compiled classes")
+def test_enable_with_compiled_classes_raises_error():
+    with pytest.raises(RuntimeError, match="compiled classes"):
+        instrumentation.enable()
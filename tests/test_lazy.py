@@ -0,0 +1,227 @@
+import numpy as np
+import pytest
+
+from fastunits.lazy import LazyQuantity, lazy
+from fastunits.quantities import ArrayQuantity, ScalarQuantity
+from fastunits.units import AffineUnitsError, IncommensurableUnitsError, Unit
+
+try:
+    import numexpr  # noqa: F401
+
+    BACKENDS = ["numpy", "numexpr"]
+except ImportError:  # pragma: no cover
+    BACKENDS = ["numpy"]
+
+
+@pytest.fixture
+def unit(dimension):
+    return Unit.base(dimension, "a")
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    return request.param
+
+
+def test_lazy_returns_lazy_quantity_with_same_unit(unit):
+    q = ArrayQuantity.from_list([1.0, 2.0, 3.0], unit)
+
+    lq = lazy(q)
+
+    assert isinstance(lq, LazyQuantity)
+    assert lq.unit == unit
+
+
+def test_lazy_expression_returns_expected_result(unit, backend):
+    q1 = ArrayQuantity.from_list([1.0, 2.0, 3.0], unit)
+    q2 = ArrayQuantity.from_list([2.0, 3.0, 4.0], unit)
+    q3 = ArrayQuantity.from_list([2.0, 2.0, 2.0], unit)
+    expected_quantity = (q1 + q2) * q3
+
+    q = ((lazy(q1) + q2) * q3).evaluate(backend=backend)
+
+    assert q.equals_exact(expected_quantity)
+
+
+def test_lazy_addition_converts_units(unit, backend):
+    u2 = unit.derived(10.0, "da")
+    q1 = ArrayQuantity.from_list([1.0, 2.0, 3.0], unit)
+    q2 = ArrayQuantity.from_list([1.0, 2.0, 3.0], u2)
+    expected_quantity = ArrayQuantity.from_list([11.0, 22.0, 33.0], unit)
+
+    q = (lazy(q1) + q2).evaluate(backend=backend)
+
+    assert q.equals_exact(expected_quantity)
+
+
+def test_lazy_subtraction_and_scaling_returns_expected_result(unit, backend):
+    q1 = ArrayQuantity.from_list([1.0, 2.0, 3.0], unit)
+    q2 = ArrayQuantity.from_list([2.0, 3.0, 4.0], unit)
+    expected_quantity = ArrayQuantity.from_list([2.0, 2.0, 2.0], unit)
+
+    q = (2 * (lazy(q2) - q1)).evaluate(backend=backend)
+
+    assert q.equals_exact(expected_quantity)
+
+
+def test_lazy_division_returns_expected_unit(unit, backend):
+    q1 = ArrayQuantity.from_list([2.0, 4.0, 6.0], unit)
+    q2 = ArrayQuantity.from_list([1.0, 2.0, 3.0], unit * unit)
+
+    q = (lazy(q1) / q2).evaluate(backend=backend)
+
+    assert q.unit == unit / (unit * unit)
+    assert (q._value == [2.0, 2.0, 2.0]).all()
+
+
+def test_lazy_blocked_evaluation_matches_eager(unit):
+    u2 = unit.derived(10.0, "da")
+    q1 = ArrayQuantity(np.arange(1000.0), unit)
+    q2 = ArrayQuantity(np.arange(1000.0), u2)
+    q3 = ArrayQuantity(np.full(1000, 3.0), unit)
+    expected_quantity = (q1 + q2) * q3
+
+    q = ((lazy(q1) + q2) * q3).evaluate(backend="numpy", block_size=64)
+
+    assert q.equals_exact(expected_quantity)
+
+
+def test_lazy_scalar_expression_returns_scalar_quantity(unit, backend):
+    q1 = ScalarQuantity(2.0, unit)
+    q2 = ScalarQuantity(3.0, unit)
+    expected_quantity = ScalarQuantity(5.0, unit)
+
+    q = (lazy(q1) + q2).evaluate(backend=backend)
+
+    assert isinstance(q, ScalarQuantity)
+    assert q == expected_quantity
+
+
+def test_lazy_addition_incommensurable_quantities_raises_error(unit):
+    q1 = ArrayQuantity.from_list([1.0, 2.0, 3.0], unit)
+    q2 = ArrayQuantity.from_list([1.0, 2.0, 3.0], unit * unit)
+
+    with pytest.raises(IncommensurableUnitsError, match="Incommensurable quantities"):
+        lazy(q1) + q2
+
+
+def test_lazy_unknown_backend_raises_error(unit):
+    q = ArrayQuantity.from_list([1.0, 2.0, 3.0], unit)
+
+    with pytest.raises(ValueError, match="Unknown backend"):
+        lazy(q).evaluate(backend="fortran")
+
+
+def test_lazy_integer_inputs_keep_eager_dtype(unit, backend):
+    q1 = ArrayQuantity.from_list([1, 2, 3], unit)
+    q2 = ArrayQuantity.from_list([2, 2, 2], unit)
+    q3 = ArrayQuantity.from_list([2 ** 40, 1, 1], unit)
+    expected_quantity = q1 * q2
+    expected_overflow = q3 * q3
+
+    q = (lazy(q1) * q2).evaluate(backend=backend)
+    q_overflow = (lazy(q3) * q3).evaluate(backend=backend)
+
+    assert q._value.dtype == expected_quantity._value.dtype
+    assert q.equals_exact(expected_quantity)
+    assert q_overflow.equals_exact(expected_overflow)
+
+
+def test_lazy_integer_inputs_with_conversion_return_floats(unit, backend):
+    u2 = unit.derived(10.0, "da")
+    q1 = ArrayQuantity.from_list([1, 2, 3], unit)
+    q2 = ArrayQuantity.from_list([1, 2, 3], u2)
+    expected_quantity = ArrayQuantity.from_list([11.0, 22.0, 33.0], unit)
+
+    q = (lazy(q1) + q2).evaluate(backend=backend)
+
+    assert q.equals_exact(expected_quantity)
+
+
+def test_lazy_quantity_on_the_right_returns_expected_result(unit, backend):
+    q1 = ArrayQuantity.from_list([1.0, 2.0, 3.0], unit)
+    q2 = ArrayQuantity.from_list([2.0, 3.0, 4.0], unit)
+    q3 = ArrayQuantity.from_list([2.0, 2.0, 2.0], unit)
+
+    q_add = (q1 + lazy(q2)).evaluate(backend=backend)
+    q_sub = (q2 - lazy(q1)).evaluate(backend=backend)
+    q_mul = (q3 * lazy(q1)).evaluate(backend=backend)
+    q_div = (q1 / lazy(q3)).evaluate(backend=backend)
+
+    assert q_add.equals_exact(q1 + q2)
+    assert (q_sub._value == [1.0, 1.0, 1.0]).all()
+    assert q_mul.equals_exact(q3 * q1)
+    assert q_div.unit == unit / unit
+    assert (q_div._value == [0.5, 1.0, 1.5]).all()
+
+
+def test_lazy_units_with_offset_follow_eager_rules(unit, backend):
+    degC = unit.shifted(273.15, "°C")
+    degF = unit.derived(5 / 9, "°R").shifted(459.67, "°F")
+    q_abs = ArrayQuantity.from_list([20.0, 30.0], degC)
+    q_delta = ArrayQuantity.from_list([300.0, 300.0], unit)
+
+    q1 = (lazy(q_delta) + q_abs).evaluate(backend=backend)
+    q2 = (lazy(q_abs) - q_delta).evaluate(backend=backend)
+
+    assert q1.is_equivalent_exact(q_delta + q_abs)
+    assert q1.unit == degC
+    assert q2.unit == degC
+    assert np.allclose(q2._value, [-280.0, -270.0])
+    with pytest.raises(AffineUnitsError, match="offset units"):
+        lazy(q_abs) + ArrayQuantity.from_list([20.0, 30.0], degF)
+    with pytest.raises(AffineUnitsError, match="offset units"):
+        lazy(q_delta) - q_abs
+    with pytest.raises(AffineUnitsError, match="offset units"):
+        2 * lazy(q_abs)
+
+
+def test_lazy_mixed_dtypes_across_intermediates_match_eager(unit, backend):
+    km = unit.derived(1e3, "ka")
+    qi1 = ArrayQuantity.from_list([1, 2, 3], unit)
+    qi2 = ArrayQuantity.from_list([2, 2, 2], unit)
+    qf = ArrayQuantity.from_list([0.5, 0.5, 0.5], unit * unit)
+    qc = ArrayQuantity(np.array([1j, 2j, 3j]), unit * unit)
+    qk = ArrayQuantity.from_list([1, 2, 3], km)
+    qf_single = ArrayQuantity(np.array([0.5, 1.5, 2.5], dtype=np.float32), unit)
+
+    q_float = (lazy(qi1) * qi2 + qf).evaluate(backend=backend)
+    q_scaled = (lazy(qf) + lazy(qk) * qk).evaluate(backend=backend)
+    q_complex = (lazy(qf_single) * qf_single + qc).evaluate(backend=backend)
+    q_division = (lazy(qi1) * qi2 / qi2).evaluate(backend=backend)
+    q_single = (lazy(qf_single) + qf_single).evaluate(backend=backend)
+
+    assert q_float.equals_exact(qi1 * qi2 + qf)
+    assert q_float._value.dtype == np.float64
+    assert q_scaled.is_equivalent_exact(qf + qk * qk)
+    assert q_complex.equals_exact(qf_single * qf_single + qc)
+    assert q_complex._value.dtype == np.complex128
+    assert (q_division._value == [1.0, 2.0, 3.0]).all()
+    assert q_single._value.dtype == np.float32
+
+
+def test_lazy_scalar_expression_keeps_eager_type(unit, backend):
+    q1 = ScalarQuantity(2, unit)
+    q2 = ScalarQuantity(3, unit)
+    q3 = ScalarQuantity(1j, unit)
+
+    q_int = (lazy(q1) * q2).evaluate(backend=backend)
+    q_complex = (lazy(q1) * q2 + q3 * q3).evaluate(backend=backend)
+
+    assert q_int._value == 6
+    assert isinstance(q_int._value, int)
+    assert q_complex._value == 5
+    assert isinstance(q_complex._value, complex)
+
+
+def test_lazy_numbers_as_operands_raise_error(unit):
+    q = ArrayQuantity.from_list([1.0, 2.0, 3.0], unit)
+
+    with pytest.raises(TypeError, match="Cannot build a lazy quantity"):
+        lazy(2)
+    with pytest.raises(TypeError, match="unsupported operand"):
+        lazy(q) * 2
+    with pytest.raises(TypeError, match="unsupported operand"):
+        lazy(q) + 2
+    with pytest.raises(TypeError, match="unsupported operand"):
+        2 - lazy(q)
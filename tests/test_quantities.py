@@ -2,9 +2,10 @@ import numpy as np
 import pytest
 from numpy.typing import NDArray
 
+from fastunits import quantities
 from fastunits.dimensions import Dimension
 from fastunits.quantities import ArrayQuantity, ScalarQuantity
-from fastunits.units import IncommensurableUnitsError, Unit
+from fastunits.units import AffineUnitsError, IncommensurableUnitsError, Unit
 
 
 @pytest.fixture
@@ -192,3 +193,83 @@ def test_scalar_quantity_product_dimensionless_does_not_leave_astray_name(dimens
     q = q1 * q2
 
     assert str(q) == expected_str
+
+
+@pytest.fixture
+def temperature_units(dimension):
+    K = Unit.base(dimension, "K")
+    degC = K.shifted(273.15, "°C")
+    degF = K.derived(5 / 9, "°R").shifted(459.67, "°F")
+
+    return K, degC, degF
+
+
+def test_scalar_quantity_to_value_affine_units_returns_expected_result(
+    temperature_units,
+):
+    K, degC, degF = temperature_units
+    q = ScalarQuantity(100.0, degC)
+
+    assert q.to_value(K) == pytest.approx(373.15)
+    assert q.to_value(degF) == pytest.approx(212.0)
+    assert q.to(degF).to_value(degC) == pytest.approx(100.0)
+
+
+def test_array_quantity_to_value_affine_units_returns_expected_result(
+    temperature_units,
+):
+    K, degC, degF = temperature_units
+    q = ArrayQuantity.from_list([-40.0, 0.0, 100.0], degC)
+    expected_value = np.array([-40.0, 32.0, 212.0])
+
+    value = q.to_value(degF)
+
+    assert np.allclose(value, expected_value)
+
+
+def test_quantity_affine_plus_delta_returns_expected_result(temperature_units):
+    K, degC, degF = temperature_units
+    q1 = ScalarQuantity(20.0, degC)
+    q2 = ScalarQuantity(9.0, degF.delta)
+    expected_quantity = ScalarQuantity(25.0, degC)
+
+    assert (q1 + q2).to_value(degC) == pytest.approx(25.0)
+    assert (q2 + q1).to_value(degC) == pytest.approx(25.0)
+    assert (q1 + q2).unit == expected_quantity.unit
+
+
+def test_quantity_affine_plus_affine_raises_error(temperature_units):
+    K, degC, degF = temperature_units
+    q1 = ScalarQuantity(20.0, degC)
+    q2 = ScalarQuantity(20.0, degF)
+
+    with pytest.raises(AffineUnitsError, match="offset units"):
+        q1 + q2
+
+
+def test_quantity_affine_times_number_raises_error(temperature_units):
+    K, degC, degF = temperature_units
+    q = ScalarQuantity(20.0, degC)
+
+    with pytest.raises(AffineUnitsError, match="offset units"):
+        2 * q
+
+
+@pytest.mark.parametrize("use_numexpr", [True, False])
+def test_array_quantity_to_value_affine_units_keeps_dtype(
+    use_numexpr, temperature_units, monkeypatch
+):
+    if use_numexpr:
+        pytest.importorskip("numexpr")
+    else:
+        monkeypatch.setattr(quantities, "numexpr", None)
+    K, degC, degF = temperature_units
+    q_single = ArrayQuantity(np.array([0.0, 100.0], dtype=np.float32), degC)
+    q_int = ArrayQuantity(np.array([0, 100]), degC)
+
+    value_single = q_single.to_value(K)
+    value_int = q_int.to_value(K)
+
+    assert value_single.dtype == np.float32
+    assert np.allclose(value_single, [273.15, 373.15])
+    assert value_int.dtype == np.float64
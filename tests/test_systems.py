@@ -0,0 +1,122 @@
+import pytest
+
+from fastunits.quantities import ArrayQuantity, ScalarQuantity
+from fastunits.systems import CODATA2014, CODATA2018, UnitSystem
+from fastunits.units import AffineUnitsError, IncommensurableUnitsError, Unit
+
+
+def _definitions(system: UnitSystem) -> "dict[str, Unit]":
+    (length,) = system.dimensions
+    m = Unit.base(length, "m")
+    return {
+        "m": m,
+        "km": m.derived(1e3, "km"),
+        "ft": m.derived(system.constants["foot"], "ft"),
+    }
+
+
+@pytest.fixture
+def system():
+    return UnitSystem("test", "L", {"foot": 0.3048}, _definitions)
+
+
+def test_unit_system_registry_is_built_lazily():
+    calls = []
+
+    def definitions(system):
+        calls.append(system)
+        return _definitions(system)
+
+    system = UnitSystem("test", "L", {"foot": 0.3048}, definitions)
+    assert calls == []
+
+    system["m"]
+    system["km"]
+
+    assert calls == [system]
+
+
+def test_unit_system_to_value_returns_expected_result(system):
+    q = ScalarQuantity(2.0, system["km"])
+
+    value = system.to_value(q, "m")
+
+    assert value == 2000.0
+
+
+def test_unit_system_to_value_matches_quantity_to_value(system):
+    q = ArrayQuantity.from_list([1.0, 2.0, 3.0], system["ft"])
+
+    value = system.to_value(q, system["m"])
+
+    assert (value == q.to_value(system["m"])).all()
+
+
+def test_unit_system_to_value_composite_units_falls_back_to_multipliers(system):
+    m = system["m"]
+    q = ScalarQuantity(1.0, system["km"] * m)
+
+    value = system.to_value(q, m * m)
+
+    assert value == 1000.0
+
+
+def test_unit_system_to_value_incommensurable_units_raises_error(system):
+    m = system["m"]
+    q = ScalarQuantity(1.0, m)
+
+    with pytest.raises(IncommensurableUnitsError, match="Incommensurable quantities"):
+        system.to_value(q, m * m)
+
+
+def test_unit_system_convert_returns_quantity_in_target_unit(system):
+    q = ScalarQuantity(1.0, system["km"])
+    expected_quantity = ScalarQuantity(1000.0, system["m"])
+
+    converted = system.convert(q, "m")
+
+    assert converted.exactly_equal(expected_quantity)
+
+
+def test_codata_versions_have_different_constants():
+    eV_2014 = CODATA2014["eV"]
+    eV_2018 = CODATA2018["eV"]
+
+    assert eV_2014._multiplier != eV_2018._multiplier
+
+
+def test_codata_cross_system_conversion_returns_expected_result():
+    q = ScalarQuantity(1.0, CODATA2014["eV"])
+    expected_value = 1.6021766208e-19 / 1.602176634e-19
+
+    value = CODATA2018.to_value(q, "eV", source=CODATA2014)
+
+    assert value == pytest.approx(expected_value, rel=1e-15)
+
+
+def test_codata_cross_system_incommensurable_units_raises_error():
+    q = ScalarQuantity(1.0, CODATA2014["eV"])
+
+    with pytest.raises(IncommensurableUnitsError, match="Incommensurable quantities"):
+        CODATA2018.to_value(q, "m", source=CODATA2014)
+
+
+def test_unit_systems_with_different_bases_raise_error(system):
+    q = ScalarQuantity(1.0, system["m"])
+
+    with pytest.raises(ValueError, match="different bases"):
+        CODATA2018.to_value(q, "m", source=system)
+
+
+def test_unit_system_to_value_units_with_offset_returns_expected_result():
+    q = ScalarQuantity(20.0, CODATA2018["°C"])
+    q_array = ArrayQuantity.from_list([273.15, 373.15], CODATA2018["K"])
+
+    assert CODATA2018.to_value(q, "K") == pytest.approx(293.15)
+    assert CODATA2018.to_value(q, "°C", source=CODATA2014) == pytest.approx(20.0)
+    assert CODATA2018.to_value(q_array, "°C") == pytest.approx([0.0, 100.0])
+
+
+def test_unit_system_conversion_factor_units_with_offset_raises_error():
+    with pytest.raises(AffineUnitsError, match="not a factor"):
+        CODATA2018.conversion_factor(CODATA2018["°C"], CODATA2018["K"])
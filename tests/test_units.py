@@ -1,6 +1,6 @@
 import pytest
 
-from fastunits.units import Unit, _Dimensionless
+from fastunits.units import AffineUnit, AffineUnitsError, Unit, _Dimensionless
 
 
 @pytest.fixture
@@ -115,3 +115,48 @@ def test_unit_str_returns_expected_result(names, expected_str, dimension):
     expected_str = "a"
 
     assert str(unit) == expected_str
+
+
+def test_unit_shifted_returns_expected_result(dimension):
+    unit_base = Unit.base(dimension, "a")
+    unit_s = unit_base.derived(2.0, "b").shifted(10.0, "c")
+    expected_unit = AffineUnit(2.0, dimension, ["c"], 20.0)
+
+    assert unit_s == expected_unit
+    assert unit_s != unit_base.derived(2.0, "c")
+
+
+def test_unit_from_unit_with_offset_keeps_offset(dimension):
+    unit_s = Unit.base(dimension, "a").shifted(10.0, "c")
+    expected_unit = AffineUnit(1.0, dimension, ["d"], 10.0)
+
+    unit_d = Unit.from_unit(unit_s, "d")
+
+    assert isinstance(unit_d, AffineUnit)
+    assert unit_d == expected_unit
+
+
+def test_affine_unit_delta_returns_multiplicative_unit(dimension):
+    unit = Unit.base(dimension, "a").shifted(10.0, "c")
+    expected_unit = Unit(1.0, dimension, ["Δc"])
+
+    assert unit.delta == expected_unit
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda u, v: u * v,
+        lambda u, v: v * u,
+        lambda u, v: u / v,
+        lambda u, v: v / u,
+        lambda u, v: 1 / u,
+        lambda u, v: u ** 2,
+    ],
+)
+def test_affine_unit_operations_raise_error(operation, dimension):
+    unit = Unit.base(dimension, "a")
+    unit_s = unit.shifted(10.0, "c")
+
+    with pytest.raises(AffineUnitsError, match="unit with offset"):
+        operation(unit_s, unit)